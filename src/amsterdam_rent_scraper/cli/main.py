@@ -30,6 +30,12 @@ def scrape(
     skip_llm: bool = typer.Option(
         False, "--skip-llm", help="Skip LLM extraction (scrape only)"
     ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Ignore cached LLM extractions and re-run the model"
+    ),
+    llm_concurrency: int = typer.Option(
+        None, "--llm-concurrency", help="LLM requests in flight (default: LLM_CONCURRENCY)"
+    ),
     ollama_model: str = typer.Option(
         "llama3", "--model", "-m", help="Ollama model name"
     ),
@@ -65,6 +71,8 @@ def scrape(
         output_dir=output_dir,
         min_price=min_price,
         max_price=max_price,
+        use_llm_cache=not no_cache,
+        llm_concurrency=llm_concurrency,
     )
 
 
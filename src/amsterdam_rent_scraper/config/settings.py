@@ -25,13 +25,23 @@ OLLAMA_BASE_URL = "http://localhost:11434"
 OLLAMA_MODEL = "llama3"  # or "mistral" — pick what you have loaded
 LLM_TIMEOUT = 120
 LLM_MAX_INPUT_CHARS = 12000  # truncate page content to fit context
+LLM_NUM_PREDICT = 600  # minimum output tokens; the extraction JSON is ~300 tokens
+LLM_NUM_CTX = 6144  # fits the prompt, LLM_MAX_INPUT_CHARS of page text and the output
+LLM_CONCURRENCY = 4  # requests in flight; match the server's OLLAMA_NUM_PARALLEL
 
 # === OUTPUT ===
 OUTPUT_DIR = Path("output")
 EXCEL_FILENAME = "amsterdam_rentals.xlsx"
 HTML_FILENAME = "amsterdam_rentals.html"
+HTML_WRITE_GZIP = True  # also write a .html.gz copy for serving with Content-Encoding: gzip
 RAW_PAGES_DIR = OUTPUT_DIR / "raw_pages"
 
+# === CACHE ===
+CACHE_DIR = Path.home() / ".cache" / "amsterdam_rent_scraper"
+JINJA_CACHE_DIR = CACHE_DIR / "jinja"
+LLM_CACHE_PATH = CACHE_DIR / "llm_extractions.sqlite3"
+GEO_CACHE_PATH = CACHE_DIR / "geocodes.sqlite3"
+
 
 @dataclass
 class RentalSite:
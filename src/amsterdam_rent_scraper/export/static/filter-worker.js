@@ -0,0 +1,90 @@
+// Filtering and sorting over the report's columnar data.
+// Runs as a Web Worker when the browser allows it; report.js also loads it as a
+// plain script so the same functions serve as the main-thread fallback.
+
+// First position among the `present` leading entries of `order` whose value fails `before`
+function bound(order, present, values, before) {
+    let lo = 0, hi = present;
+    while (lo < hi) {
+        const mid = (lo + hi) >>> 1;
+        if (before(values[order[mid]])) lo = mid + 1;
+        else hi = mid;
+    }
+    return lo;
+}
+
+// Count a hit for every listing whose value lies in [min, max], found with two binary
+// searches over the column's ascending order instead of a scan of every value.
+// Returns 0 without marking when the range excludes nothing, 1 otherwise.
+function markRange(hits, order, present, values, min, max) {
+    const lo = bound(order, present, values, v => v < min);
+    const hi = bound(order, present, values, v => v <= max);
+    if (lo === 0 && hi === present) return 0;
+    for (let k = lo; k < hi; k++) hits[order[k]]++;
+    // Missing values (-1) are ordered last and never filter a listing out
+    for (let k = present; k < order.length; k++) hits[order[k]]++;
+    return 1;
+}
+
+function filterIndices(columns, filters) {
+    const { price, rooms, distance, furnished, source, orders, present } = columns;
+    // Only the ranges that actually exclude listings are marked and required
+    const hits = new Uint8Array(price.length);
+    const required =
+        markRange(hits, orders.price_eur, present.price_eur, price, filters.minPrice, filters.maxPrice) +
+        markRange(hits, orders.rooms, present.rooms, rooms, filters.minRooms, Infinity) +
+        markRange(hits, orders.distance_km, present.distance_km, distance, -Infinity, filters.maxDistance);
+
+    const result = [];
+    for (let i = 0; i < hits.length; i++) {
+        if (hits[i] !== required) continue;
+        // Categorical filters arrive as integer codes, 0 meaning "any"
+        if (filters.furnished && furnished[i] !== filters.furnished) continue;
+        if (filters.source && source[i] !== filters.source) continue;
+        result.push(i);
+    }
+    return Uint32Array.from(result);
+}
+
+function sortIndices(indices, columns, sort) {
+    // Rows ship pre-sorted by price ascending and filtering keeps that order
+    if (sort.column === 'price_eur' && sort.direction === 'asc') return indices;
+
+    // Small results: comparison sort, where ranks precomputed per direction keep the
+    // comparator a single subtraction
+    const n = columns.price.length;
+    if (indices.length * Math.log2(indices.length + 1) < n) {
+        const rank = (sort.direction === 'asc' ? columns.ranks : columns.descRanks)[sort.column];
+        return indices.sort((a, b) => rank[a] - rank[b]);
+    }
+
+    // Large results: walk the column's precomputed order once and keep the selected
+    // listings, O(N) with no comparisons
+    const order = columns.orders[sort.column];
+    const present = columns.present[sort.column];
+    const selected = new Uint8Array(n);
+    for (let k = 0; k < indices.length; k++) selected[indices[k]] = 1;
+    const result = new Uint32Array(indices.length);
+    let out = 0;
+    if (sort.direction === 'asc') {
+        for (let p = 0; p < n; p++) if (selected[order[p]]) result[out++] = order[p];
+    } else {
+        // Present values reversed, missing values still last
+        for (let p = present - 1; p >= 0; p--) if (selected[order[p]]) result[out++] = order[p];
+        for (let p = present; p < n; p++) if (selected[order[p]]) result[out++] = order[p];
+    }
+    return result;
+}
+
+if (typeof importScripts === 'function') {
+    let columns = null;
+    self.onmessage = event => {
+        const message = event.data;
+        if (message.type === 'init') {
+            columns = message.columns;
+            return;
+        }
+        const indices = sortIndices(filterIndices(columns, message.filters), columns, message.sort);
+        self.postMessage({ id: message.id, indices }, [indices.buffer]);
+    };
+}
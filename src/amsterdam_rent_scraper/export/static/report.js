@@ -0,0 +1,423 @@
+// payload, workLocation and workAddress are defined inline by the generated report
+
+// DOM elements, looked up once
+const $ = id => document.getElementById(id);
+const elMinPrice = $('minPrice'), elMaxPrice = $('maxPrice'), elMinRooms = $('minRooms'), elMaxDistance = $('maxDistance'), elFurnished = $('furnished'), elSource = $('source');
+const elTableScroller = $('tableScroller'), elTopSpacer = $('topSpacer'), elBottomSpacer = $('bottomSpacer'), elNoResults = $('noResults');
+const elStatCount = $('statCount'), elStatAvgPrice = $('statAvgPrice'), elStatAvgSize = $('statAvgSize');
+const elBtnTable = $('btnTable'), elBtnMap = $('btnMap'), elMap = $('map');
+const filterInputs = [elMinPrice, elMaxPrice, elMinRooms, elMaxDistance, elFurnished, elSource];
+
+const listings = payload.rows.map(row => Object.fromEntries(payload.cols.map((col, i) => [col, row[i]])));
+
+// Numeric filter columns arrive as base64 little-endian typed arrays; -1 marks a missing value
+function decodeColumn(base64, ArrayType) {
+    const bytes = Uint8Array.from(atob(base64), c => c.charCodeAt(0));
+    return new ArrayType(bytes.buffer);
+}
+
+const listingCount = listings.length;
+const priceCol = decodeColumn(payload.filters.price_eur, Float64Array);
+const roomsCol = decodeColumn(payload.filters.rooms, Int16Array);
+const distanceCol = decodeColumn(payload.filters.distance_km, Float64Array);
+const surfaceCol = decodeColumn(payload.filters.surface_m2, Float64Array);
+
+// Per-column orderings, with the count of non-missing leading entries, from the Python
+// side; missing values come last in both directions, so descending ranks reverse only the
+// present values
+const sortOrders = {};
+const sortRanks = {};
+const sortDescRanks = {};
+const presentCounts = {};
+for (const [column, order] of Object.entries(payload.order)) {
+    const present = payload.present[column];
+    const rank = new Int32Array(listingCount);
+    const descRank = new Int32Array(listingCount);
+    order.forEach((listingIndex, position) => {
+        rank[listingIndex] = position;
+        descRank[listingIndex] = position < present ? present - 1 - position : position;
+    });
+    sortOrders[column] = Int32Array.from(order);
+    sortRanks[column] = rank;
+    sortDescRanks[column] = descRank;
+    presentCounts[column] = present;
+}
+
+// Categorical filter columns as small integer codes so the filter loop compares numbers;
+// code 0 is the empty value, which the select boxes use for "any"
+function encodeCategories(values) {
+    const codes = new Map([['', 0]]);
+    const column = new Uint16Array(values.length);
+    values.forEach((value, i) => {
+        const key = value || '';
+        if (!codes.has(key)) codes.set(key, codes.size);
+        column[i] = codes.get(key);
+    });
+    return { column, codes };
+}
+
+const furnishedCategories = encodeCategories(listings.map(l => l.furnished));
+const sourceCategories = encodeCategories(listings.map(l => l.source_site));
+
+// Everything filterIndices/sortIndices (filter-worker.js) need, in a structured-cloneable shape
+const columns = {
+    price: priceCol,
+    rooms: roomsCol,
+    distance: distanceCol,
+    furnished: furnishedCategories.column,
+    source: sourceCategories.column,
+    orders: sortOrders,
+    ranks: sortRanks,
+    descRanks: sortDescRanks,
+    present: presentCounts,
+};
+
+let map = null;
+let markerCluster = null;
+let currentSort = { column: 'price_eur', direction: 'asc' };
+let currentResults = [];
+
+function initMap() {
+    // One shared canvas for every listing marker instead of a DOM node each
+    map = L.map('map', { preferCanvas: true }).setView(workLocation, 12);
+    L.tileLayer('https://{s}.tile.openstreetmap.org/{z}/{x}/{y}.png', {
+        attribution: '&copy; OpenStreetMap contributors'
+    }).addTo(map);
+
+    // Work location marker
+    L.marker(workLocation, {
+        icon: L.divIcon({
+            className: 'work-marker',
+            html: 'Work',
+            iconSize: [50, 30]
+        })
+    }).addTo(map).bindPopup('<b>Work Location</b><br>' + workAddress);
+}
+
+// Marker fill per server-computed price band; matches the price colours in report.css
+const MARKER_COLORS = {
+    'price price-low': '#27ae60',
+    'price price-mid': '#f39c12',
+    'price price-high': '#e74c3c',
+};
+
+function createMarker(listing) {
+    // Circle markers draw on the map's canvas; popup markup is rendered once by the server
+    const color = MARKER_COLORS[listing.price_class] || '#95a5a6';
+    return L.circleMarker([listing.latitude, listing.longitude], { radius: 8, color, weight: 1, fillOpacity: 0.9 })
+        .bindPopup(listing.popup_html);
+}
+
+// Markers are created once per listing and reused by every later filter change
+const markerCache = new Map();
+
+function markerFor(listing) {
+    let marker = markerCache.get(listing);
+    if (!marker) {
+        marker = createMarker(listing);
+        markerCache.set(listing, marker);
+    }
+    return marker;
+}
+
+// Safari has no requestIdleCallback; approximate it with a short timeout
+const whenIdle = window.requestIdleCallback || (callback => setTimeout(() => callback({ timeRemaining: () => 8 }), 1));
+let markerJob = 0;
+
+function updateMap(filteredListings) {
+    if (!markerCluster) {
+        // chunkedLoading spreads addLayers over short time slices instead of one long task
+        markerCluster = L.markerClusterGroup({ chunkedLoading: true, chunkInterval: 50, maxClusterRadius: 60 });
+        map.addLayer(markerCluster);
+    }
+    markerCluster.clearLayers();
+
+    // Build markers in idle-time batches; a newer updateMap call abandons this one
+    const job = ++markerJob;
+    let next = 0;
+    function step(deadline) {
+        if (job !== markerJob) return;
+        const markers = [];
+        do {
+            const listing = filteredListings[next++];
+            if (listing.latitude && listing.longitude) markers.push(markerFor(listing));
+        } while (next < filteredListings.length && deadline.timeRemaining() > 1);
+        markerCluster.addLayers(markers);
+        if (next < filteredListings.length) whenIdle(step);
+    }
+    if (filteredListings.length) whenIdle(step);
+}
+
+// Windowed table: only the rows in view (plus a buffer) exist in the DOM
+const ROW_HEIGHT = 40;  // CSS height of tr.listing-row; replaced by the measured height once rows exist
+let rowHeight = ROW_HEIGHT;
+let rowHeightMeasured = false;
+const ROW_BUFFER = 10;
+const ROW_CHUNK = 20;  // the window's edges snap to multiples of this many rows (~800px)
+const rowPool = [];
+let tableRows = [];
+let renderedStart = -1, renderedEnd = -1;
+
+const rowTemplate = $('rowTpl').content.firstElementChild;
+
+// The first screenful of the default view is server-rendered; adopt those rows into the
+// pool so the initial render finds them already filled
+document.querySelectorAll('#tableBody tr.listing-row').forEach(row => {
+    row.listing = listings[row.dataset.index];
+    rowPool.push(row);
+});
+
+function createRow() {
+    return rowTemplate.cloneNode(true);
+}
+
+function fillRow(row, listing) {
+    const cells = row.children;
+    cells[0].textContent = listing.source_site || '-';
+    cells[1].textContent = `EUR ${listing.price_eur || '?'}`;
+    cells[1].className = listing.price_class;
+    cells[2].textContent = listing.address || listing.title || '-';
+    cells[3].textContent = listing.surface_m2 ? listing.surface_m2 + ' m2' : '-';
+    cells[4].textContent = listing.rooms || '-';
+    const tag = cells[5].firstChild;
+    tag.textContent = listing.furnished || '-';
+    tag.className = listing.furnished_class;
+    cells[6].textContent = listing.available_date || '-';
+    cells[7].textContent = listing.distance_km ? listing.distance_km.toFixed(1) + ' km' : '-';
+    cells[8].textContent = listing.description_summary || '-';
+    cells[8].title = listing.description_summary || '';
+    cells[9].firstChild.href = listing.listing_url;
+}
+
+function renderVisibleRows() {
+    // Snap the buffered window to whole chunks so it moves once per chunk scrolled rather
+    // than once per row, each move refilling the pool in a single pass
+    const first = Math.floor(elTableScroller.scrollTop / rowHeight);
+    const last = first + Math.ceil(elTableScroller.clientHeight / rowHeight);
+    const start = Math.max(0, Math.floor((first - ROW_BUFFER) / ROW_CHUNK) * ROW_CHUNK);
+    const end = Math.min(tableRows.length, Math.ceil((last + ROW_BUFFER) / ROW_CHUNK) * ROW_CHUNK);
+    // Scroll events fire many times per row; only touch the DOM when the window moves
+    if (start === renderedStart && end === renderedEnd) return;
+    renderedStart = start;
+    renderedEnd = end;
+
+    if (rowPool.length < end - start) {
+        const fragment = document.createDocumentFragment();
+        while (rowPool.length < end - start) {
+            const row = createRow();
+            rowPool.push(row);
+            fragment.appendChild(row);
+        }
+        elBottomSpacer.parentNode.insertBefore(fragment, elBottomSpacer);
+    }
+
+    elTopSpacer.style.height = (start * rowHeight) + 'px';
+    elBottomSpacer.style.height = ((tableRows.length - end) * rowHeight) + 'px';
+    rowPool.forEach((row, i) => {
+        const listing = start + i < end ? tableRows[start + i] : null;
+        if (listing && row.listing !== listing) fillRow(row, listing);
+        row.listing = listing;
+        const display = listing ? '' : 'none';
+        if (row.style.display !== display) row.style.display = display;
+    });
+
+    // Measure one rendered row once so the spacers match the real layout (font scaling, zoom)
+    if (!rowHeightMeasured && end > start) {
+        const measured = rowPool[0].offsetHeight;
+        if (!measured) return;  // table hidden; try again on the next render
+        rowHeightMeasured = true;
+        if (measured !== rowHeight) {
+            rowHeight = measured;
+            renderedStart = renderedEnd = -1;
+            renderVisibleRows();
+        }
+    }
+}
+
+function renderTable(data) {
+    tableRows = data;
+    renderedStart = renderedEnd = -1;
+
+    if (data.length === 0) {
+        elNoResults.style.display = 'block';
+        elTableScroller.style.display = 'none';
+        return;
+    }
+
+    elNoResults.style.display = 'none';
+    elTableScroller.style.display = 'block';
+    elTableScroller.scrollTop = 0;
+    renderVisibleRows();
+}
+
+function updateStats(indices) {
+    elStatCount.textContent = indices.length;
+
+    // One pass over the typed columns for both averages; missing (-1) and zero values are skipped
+    let priceSum = 0, priceCount = 0, sizeSum = 0, sizeCount = 0;
+    for (let k = 0; k < indices.length; k++) {
+        const i = indices[k];
+        const price = priceCol[i], size = surfaceCol[i];
+        if (price > 0) { priceSum += price; priceCount++; }
+        if (size > 0) { sizeSum += size; sizeCount++; }
+    }
+    elStatAvgPrice.textContent = priceCount ? 'EUR ' + Math.round(priceSum / priceCount) : '-';
+    elStatAvgSize.textContent = sizeCount ? Math.round(sizeSum / sizeCount) + ' m2' : '-';
+}
+
+function readFilters() {
+    return {
+        minPrice: parseInt(elMinPrice.value) || 0,
+        maxPrice: parseInt(elMaxPrice.value) || 99999,
+        minRooms: parseInt(elMinRooms.value) || 0,
+        maxDistance: parseFloat(elMaxDistance.value) || 99999,
+        furnished: elFurnished.value,
+        source: elSource.value,
+    };
+}
+
+// Only the visible view renders a new result set; the other catches up when shown
+let currentView = 'table';
+let tableStale = false;
+let mapStale = true;
+
+function renderResults(indices) {
+    currentResults = Array.from(indices, i => listings[i]);
+    updateStats(indices);
+    if (currentView === 'table') renderTable(currentResults);
+    else tableStale = true;
+    if (currentView === 'map') updateMap(currentResults);
+    else mapStale = true;
+}
+
+// Recent results keyed by filters and sort, so flipping a sort back or retyping a
+// filter value reuses the earlier index list instead of filtering again
+const RESULT_CACHE_SIZE = 8;
+const resultCache = new Map();
+
+function cacheResult(key, indices) {
+    if (resultCache.size >= RESULT_CACHE_SIZE) resultCache.delete(resultCache.keys().next().value);
+    resultCache.set(key, indices);
+}
+
+// Filter off the main thread when workers are available (file:// pages often refuse them)
+let filterWorker = null;
+let filterRequestId = 0;
+let filterRequestKey = '';
+try {
+    filterWorker = new Worker('filter-worker.js');
+    filterWorker.postMessage({ type: 'init', columns });
+    filterWorker.onmessage = event => {
+        // Drop replies to requests that a newer applyFilters() call has superseded
+        if (event.data.id !== filterRequestId) return;
+        cacheResult(filterRequestKey, event.data.indices);
+        renderResults(event.data.indices);
+    };
+    filterWorker.onerror = () => {
+        filterWorker = null;
+        applyFilters();
+    };
+} catch (e) {
+    filterWorker = null;
+}
+
+function applyFilters() {
+    const filters = readFilters();
+    const key = JSON.stringify([filters, currentSort]);
+    // Any in-flight worker reply is now stale, whichever path serves this request
+    filterRequestId++;
+    filterRequestKey = key;
+
+    const cached = resultCache.get(key);
+    if (cached) {
+        renderResults(cached);
+        return;
+    }
+    // A value no listing has (-1) matches nothing; 0 leaves the column unfiltered
+    const query = {
+        ...filters,
+        furnished: furnishedCategories.codes.get(filters.furnished) ?? -1,
+        source: sourceCategories.codes.get(filters.source) ?? -1,
+    };
+    if (filterWorker) {
+        filterWorker.postMessage({ type: 'filter', id: filterRequestId, filters: query, sort: currentSort });
+        return;
+    }
+    const indices = sortIndices(filterIndices(columns, query), columns, currentSort);
+    cacheResult(key, indices);
+    renderResults(indices);
+}
+
+// Coalesce bursts of input events into at most one filter pass per animation frame
+let filterFrame = 0;
+function scheduleFilters() {
+    cancelAnimationFrame(filterFrame);
+    filterFrame = requestAnimationFrame(applyFilters);
+}
+
+// Typing a number fires an input event per keystroke; wait for a short pause first
+const FILTER_DEBOUNCE_MS = 120;
+let filterTimer = 0;
+function debounceFilters() {
+    clearTimeout(filterTimer);
+    filterTimer = setTimeout(scheduleFilters, FILTER_DEBOUNCE_MS);
+}
+
+function resetFilters() {
+    elMinPrice.value = elMinPrice.defaultValue;
+    elMaxPrice.value = elMaxPrice.defaultValue;
+    elMinRooms.value = '';
+    elMaxDistance.value = '';
+    elFurnished.value = '';
+    elSource.value = '';
+    applyFilters();
+}
+
+function showView(view) {
+    currentView = view;
+    elBtnTable.classList.toggle('active', view === 'table');
+    elBtnMap.classList.toggle('active', view === 'map');
+    elMap.classList.toggle('visible', view === 'map');
+
+    if (view === 'table') {
+        if (tableStale) {
+            tableStale = false;
+            renderTable(currentResults);
+        } else {
+            elTableScroller.style.display = 'block';
+            renderVisibleRows();
+        }
+    } else {
+        elTableScroller.style.display = 'none';
+        if (!map) initMap();
+        if (mapStale) {
+            mapStale = false;
+            updateMap(currentResults);
+        }
+    }
+}
+
+elTableScroller.addEventListener('scroll', renderVisibleRows);
+
+filterInputs.forEach(el => el.addEventListener('input', el.tagName === 'SELECT' ? scheduleFilters : debounceFilters));
+
+// Sorting
+document.querySelectorAll('th[data-sort]').forEach(th => {
+    th.addEventListener('click', () => {
+        const column = th.dataset.sort;
+        if (currentSort.column === column) {
+            currentSort.direction = currentSort.direction === 'asc' ? 'desc' : 'asc';
+        } else {
+            currentSort.column = column;
+            currentSort.direction = 'asc';
+        }
+
+        document.querySelectorAll('th').forEach(t => t.classList.remove('sorted-asc', 'sorted-desc'));
+        th.classList.add(`sorted-${currentSort.direction}`);
+
+        scheduleFilters();
+    });
+});
+
+// Initial render
+applyFilters();
@@ -0,0 +1,20 @@
+"""On-disk cache of LLM extraction results, keyed by page content."""
+
+import hashlib
+
+from amsterdam_rent_scraper.utils.sqlite_cache import SQLiteCache
+
+
+def cache_key(*parts: str) -> str:
+    """Hash the inputs that determine an extraction result into a short key."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class ExtractionCache(SQLiteCache):
+    """Mapping from cache_key() to the parsed LLM JSON."""
+
+    table = "extractions"
@@ -1,22 +1,53 @@
 """LLM-based extraction using Ollama for structured data extraction from rental listings."""
 
-import json
+import asyncio
 import re
+from pathlib import Path
 from typing import Optional
 
+import httpx
+import lxml.html
 import ollama
+import orjson
+from lxml import etree
 from rich.console import Console
+from tqdm import tqdm
 
 from amsterdam_rent_scraper.config.settings import (
+    LLM_CACHE_PATH,
+    LLM_CONCURRENCY,
     LLM_MAX_INPUT_CHARS,
+    LLM_NUM_CTX,
+    LLM_NUM_PREDICT,
     LLM_TIMEOUT,
     OLLAMA_BASE_URL,
     OLLAMA_MODEL,
 )
+from amsterdam_rent_scraper.llm.cache import ExtractionCache, cache_key
 
 console = Console()
 
-EXTRACTION_PROMPT = """You are extracting structured rental listing information from a Dutch housing website page.
+# Keep one idle connection per concurrent request alive between calls, so each
+# listing reuses a pooled connection instead of reconnecting to the server
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=LLM_CONCURRENCY, keepalive_expiry=60.0)
+HTTP_TIMEOUT = httpx.Timeout(LLM_TIMEOUT, connect=10.0)
+
+GENERATE_OPTIONS = {"temperature": 0.1, "num_predict": LLM_NUM_PREDICT, "num_ctx": LLM_NUM_CTX}
+
+
+def generate_options(text: str) -> dict:
+    """Model options for one page; long pages get a larger output budget.
+
+    The summary and pros/cons grow with the page, so allow ~1 output token per 40
+    characters of page text on top of a 400-token base, never below LLM_NUM_PREDICT
+    (the full JSON object needs that much). LLM_MAX_INPUT_CHARS bounds the result.
+    """
+    return {**GENERATE_OPTIONS, "num_predict": max(LLM_NUM_PREDICT, 400 + len(text) // 40)}
+
+
+# The static instructions go first as the system message so Ollama's prompt cache can
+# reuse their prefill across listings; only the user message changes per page.
+SYSTEM_PROMPT = """You are extracting structured rental listing information from a Dutch housing website page.
 
 Extract the following fields from the content. Return ONLY valid JSON with these exact keys (use null for missing values):
 
@@ -55,122 +86,314 @@ Important:
 - For price, extract the monthly rent amount only
 - For surface_m2, extract the number only
 - Summarize the description in 2-3 sentences
-- Identify pros/cons based on the listing description
+- Identify pros/cons based on the listing description"""
 
-PAGE CONTENT:
+USER_TEMPLATE = """PAGE CONTENT:
 {content}
 
 Respond with ONLY the JSON object, no explanation or markdown."""
 
 
+# Page text is UTF-8 encoded before parsing so lxml never trips over an in-page
+# encoding declaration on an already-decoded string
+_HTML_PARSER = lxml.html.HTMLParser(encoding="utf-8")
+_NON_CONTENT = ("script", "style", "nav", "footer", "header", etree.Comment)
+# Inline scripts and styles are often most of a listing page; cut them before parsing
+_SCRIPT_STYLE_RE = re.compile(r"<(script|style)\b[^>]*>.*?</\1\s*>", re.IGNORECASE | re.DOTALL)
+
+
 def extract_text_from_html(html: str) -> str:
     """Extract readable text from HTML, removing scripts and styles."""
-    from bs4 import BeautifulSoup
-
-    soup = BeautifulSoup(html, "lxml")
+    # Leave a line break in their place so the text on either side stays apart
+    html = _SCRIPT_STYLE_RE.sub("\n", html)
+    if not html.strip():
+        return ""
 
-    # Remove script and style elements
-    for tag in soup(["script", "style", "nav", "footer", "header"]):
-        tag.decompose()
+    try:
+        tree = lxml.html.fromstring(html.encode("utf-8"), parser=_HTML_PARSER)
+    except etree.ParserError:
+        # Comment-, doctype- or PI-only pages have no document element
+        return ""
+
+    # Remove script and style elements, keeping the text that follows them on its own
+    # line rather than glued to the text before them
+    for element in tree.iter(*_NON_CONTENT):
+        element.tail = "\n" + (element.tail or "")
+    etree.strip_elements(tree, *_NON_CONTENT, with_tail=False)
+
+    # Get text, one line per text node, skipping blank lines; stop walking the tree
+    # once there is enough text to fill the LLM context
+    lines = []
+    length = 0
+    for chunk in tree.itertext():
+        for line in chunk.splitlines():
+            line = line.strip()
+            if line:
+                lines.append(line)
+                length += len(line) + 1
+        if length > LLM_MAX_INPUT_CHARS:
+            break
 
-    # Get text
-    text = soup.get_text(separator="\n", strip=True)
+    # Truncate to fit LLM context
+    return "\n".join(lines)[:LLM_MAX_INPUT_CHARS]
+
+
+# Specialised once: the system message is shared and the user template is pre-split,
+# so building a prompt is a single concatenation
+_SYSTEM_MESSAGE = {"role": "system", "content": SYSTEM_PROMPT}
+_USER_HEAD, _USER_TAIL = USER_TEMPLATE.split("{content}")
+
+
+def build_messages(text: str) -> list[dict]:
+    """Chat messages for one page: the shared system prompt, then the page text."""
+    return [_SYSTEM_MESSAGE, {"role": "user", "content": _USER_HEAD + text + _USER_TAIL}]
+
+
+class JsonSpanScanner:
+    """Incrementally find the first balanced {...} span, skipping braces inside strings.
+
+    Text can be fed in pieces as it streams in; feed() reports when the span is complete.
+    """
+
+    def __init__(self):
+        self._parts: list[str] = []
+        self._length = 0
+        self._start = -1
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self.span: Optional[str] = None
+
+    @property
+    def text(self) -> str:
+        """Everything fed so far."""
+        return "".join(self._parts)
+
+    def feed(self, chunk: str) -> bool:
+        """Consume more text; return True once the first balanced object is complete."""
+        if self.span is not None:
+            return True
+        offset = self._length
+        self._parts.append(chunk)
+        self._length += len(chunk)
+
+        for i, char in enumerate(chunk):
+            if self._start == -1:
+                if char != "{":
+                    continue
+                self._start = offset + i
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char == "{":
+                self._depth += 1
+            elif char == "}":
+                self._depth -= 1
+                if self._depth == 0:
+                    self.span = self.text[self._start : offset + i + 1]
+                    return True
+        return False
 
-    # Clean up whitespace
-    lines = [line.strip() for line in text.splitlines() if line.strip()]
-    text = "\n".join(lines)
 
-    # Truncate to fit LLM context
-    return text[:LLM_MAX_INPUT_CHARS]
+def _find_json_span(text: str) -> Optional[str]:
+    """Return the first balanced {...} span in text, skipping braces inside strings."""
+    scanner = JsonSpanScanner()
+    scanner.feed(text)
+    return scanner.span
 
 
 def extract_json_from_response(response: str) -> Optional[dict]:
     """Try to extract JSON from LLM response."""
-    # Try direct parse first
+    # Try direct parse first; with format="json" this is the only step that runs
     try:
-        return json.loads(response)
-    except json.JSONDecodeError:
+        return orjson.loads(response)
+    except orjson.JSONDecodeError:
         pass
 
-    # Try to find JSON block in response
-    json_match = re.search(r"\{[\s\S]*\}", response)
-    if json_match:
-        try:
-            return json.loads(json_match.group())
-        except json.JSONDecodeError:
-            pass
-
-    # Try to fix common issues
-    cleaned = response.strip()
-    if cleaned.startswith("```json"):
-        cleaned = cleaned[7:]
-    if cleaned.startswith("```"):
-        cleaned = cleaned[3:]
-    if cleaned.endswith("```"):
-        cleaned = cleaned[:-3]
-
+    # Otherwise take the first balanced object, which also looks past markdown fences
+    # and any explanation the model wrapped around it
+    span = _find_json_span(response)
+    if span is None:
+        return None
     try:
-        return json.loads(cleaned.strip())
-    except json.JSONDecodeError:
+        return orjson.loads(span)
+    except orjson.JSONDecodeError:
         return None
 
 
 class OllamaExtractor:
     """Extract structured data from rental listings using Ollama LLM."""
 
-    def __init__(self, model: str = None, base_url: str = None):
+    def __init__(self, model: str = None, base_url: str = None, use_cache: bool = True):
         self.model = model or OLLAMA_MODEL
         self.base_url = base_url or OLLAMA_BASE_URL
-        self.client = ollama.Client(host=self.base_url)
+        self.client = ollama.Client(host=self.base_url, timeout=HTTP_TIMEOUT, limits=HTTP_LIMITS)
+        # Results keyed by page text, model and prompt; re-runs skip the LLM for known pages
+        self.cache = ExtractionCache.open(LLM_CACHE_PATH, "LLM extraction") if use_cache else None
+        self._available: Optional[bool] = None
 
     def is_available(self) -> bool:
-        """Check if Ollama is running and model is available."""
+        """Check if Ollama is running and model is available.
+
+        The server is probed once per extractor; use refresh_availability() to re-check.
+        """
+        if self._available is None:
+            return self.refresh_availability()
+        return self._available
+
+    def refresh_availability(self) -> bool:
+        """Probe the Ollama server for the model, updating the cached answer."""
         try:
             models = self.client.list()
             model_names = [m.model for m in models.models]
             # Check if our model (or a variant) is available
             for name in model_names:
                 if self.model in name or name.startswith(self.model):
+                    self._available = True
                     return True
             console.print(
                 f"[yellow]Model {self.model} not found. Available: {model_names}[/]"
             )
-            return False
         except Exception as e:
             console.print(f"[red]Ollama not available: {e}[/]")
-            return False
+        self._available = False
+        return False
+
+    def _cached(self, text: str) -> tuple[str, Optional[dict]]:
+        """Return the cache key for a page's text and any stored result for it."""
+        key = cache_key(self.model, SYSTEM_PROMPT, USER_TEMPLATE, text)
+        llm_data = self.cache.get(key) if self.cache else None
+        return key, llm_data if isinstance(llm_data, dict) else None
+
+    def _store(self, key: str, llm_data: Optional[dict]) -> None:
+        # Only JSON objects are worth replaying; _merge cannot use anything else
+        if isinstance(llm_data, dict) and llm_data and self.cache:
+            self.cache.set(key, llm_data)
+
+    def _merge(self, llm_data: Optional[dict], raw_data: dict = None) -> dict:
+        """Merge parsed LLM data into raw_data."""
+        if llm_data:
+            # Merge with raw_data, preferring raw_data for existing fields
+            if raw_data:
+                for key, value in llm_data.items():
+                    if key not in raw_data or raw_data.get(key) is None:
+                        raw_data[key] = value
+                return raw_data
+            return llm_data
+        else:
+            console.print("[yellow]Could not parse LLM response as JSON[/]")
+            return raw_data or {}
+
+    def _chat_request(self, text: str) -> dict:
+        """Keyword arguments for a streamed chat request extracting one page."""
+        return {
+            "model": self.model,
+            "messages": build_messages(text),
+            "format": "json",
+            "options": generate_options(text),
+            "stream": True,
+        }
+
+    def _finish(self, key: str, scanner: JsonSpanScanner, raw_data: dict = None) -> dict:
+        """Parse the streamed reply, cache it and merge it into raw_data."""
+        llm_data = extract_json_from_response(scanner.span or scanner.text)
+        self._store(key, llm_data)
+        return self._merge(llm_data, raw_data)
 
     def extract_from_html(self, html: str, raw_data: dict = None) -> dict:
         """Extract structured fields from HTML content using LLM."""
-        text = extract_text_from_html(html)
-
-        prompt = EXTRACTION_PROMPT.format(content=text)
-
         try:
-            response = self.client.generate(
-                model=self.model,
-                prompt=prompt,
-                options={"temperature": 0.1, "num_predict": 2000},
-            )
+            text = extract_text_from_html(html)
+            key, llm_data = self._cached(text)
+            if llm_data is not None:
+                return self._merge(llm_data, raw_data)
+
+            # Stream the reply and hang up as soon as the JSON object closes, so the
+            # server stops generating the trailing whitespace JSON mode tends to emit
+            scanner = JsonSpanScanner()
+            stream = self.client.chat(**self._chat_request(text))
+            try:
+                for chunk in stream:
+                    if scanner.feed(chunk.message.content):
+                        break
+            finally:
+                stream.close()
+            return self._finish(key, scanner, raw_data)
 
-            llm_data = extract_json_from_response(response.response)
+        except Exception as e:
+            console.print(f"[red]LLM extraction failed: {e}[/]")
+            return raw_data or {}
 
-            if llm_data:
-                # Merge with raw_data, preferring raw_data for existing fields
-                if raw_data:
-                    for key, value in llm_data.items():
-                        if key not in raw_data or raw_data.get(key) is None:
-                            raw_data[key] = value
-                    return raw_data
-                return llm_data
-            else:
-                console.print("[yellow]Could not parse LLM response as JSON[/]")
-                return raw_data or {}
+    async def _extract_from_html_async(
+        self, client: ollama.AsyncClient, html: str, raw_data: dict = None
+    ) -> dict:
+        """Async variant of extract_from_html, sharing one AsyncClient per batch.
+
+        Only the awaits differ; request building and reply handling are shared.
+        """
+        try:
+            # Parse off the event loop so other requests' responses keep being read meanwhile
+            text = await asyncio.to_thread(extract_text_from_html, html)
+            key, llm_data = self._cached(text)
+            if llm_data is not None:
+                return self._merge(llm_data, raw_data)
+
+            scanner = JsonSpanScanner()
+            stream = await client.chat(**self._chat_request(text))
+            try:
+                async for chunk in stream:
+                    if scanner.feed(chunk.message.content):
+                        break
+            finally:
+                await stream.aclose()
+            return self._finish(key, scanner, raw_data)
 
         except Exception as e:
             console.print(f"[red]LLM extraction failed: {e}[/]")
             return raw_data or {}
 
+    def enrich_listings(self, listings: list[dict], concurrency: int = None) -> None:
+        """Enrich listings in place, keeping up to `concurrency` LLM requests in flight.
+
+        Ollama only serves requests in parallel up to its OLLAMA_NUM_PARALLEL setting
+        (and keeps OLLAMA_MAX_LOADED_MODELS models resident); anything beyond that
+        queues on the server.
+        """
+        asyncio.run(self._enrich_listings_async(listings, concurrency or LLM_CONCURRENCY))
+
+    async def _enrich_listings_async(self, listings: list[dict], concurrency: int) -> None:
+        # The AsyncClient is bound to this event loop, so create it per batch
+        client = ollama.AsyncClient(host=self.base_url, timeout=HTTP_TIMEOUT, limits=HTTP_LIMITS)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        try:
+            with tqdm(total=len(listings), desc="LLM extraction") as progress:
+
+                async def enrich(listing: dict) -> None:
+                    raw_path = listing.get("raw_page_path")
+                    if raw_path:
+                        # Read inside the semaphore so only `concurrency` pages are held in
+                        # memory, and off the event loop so reads overlap in-flight requests
+                        async with semaphore:
+                            try:
+                                html = await asyncio.to_thread(Path(raw_path).read_text, encoding="utf-8")
+                            except Exception as e:
+                                console.print(f"[red]Could not read HTML file: {e}[/]")
+                            else:
+                                listing.update(await self._extract_from_html_async(client, html, listing))
+                    progress.update()
+
+                await asyncio.gather(*(enrich(listing) for listing in listings))
+        finally:
+            # Close the connection pool before asyncio.run tears down the loop
+            await client.close()
+
     def enrich_listing(self, listing_data: dict, raw_html_path: str = None) -> dict:
         """Enrich a listing with LLM-extracted data."""
         if raw_html_path:
@@ -1,6 +1,8 @@
 """Main pipeline that orchestrates scraping, LLM extraction, and export."""
 
 import importlib
+import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -9,6 +11,7 @@ from rich.console import Console
 from tqdm import tqdm
 
 from amsterdam_rent_scraper.config.settings import (
+    HTML_WRITE_GZIP,
     MIN_PRICE,
     MAX_PRICE,
     OUTPUT_DIR,
@@ -30,6 +33,21 @@ def load_scraper_class(dotted_path: str):
     return getattr(module, class_name)
 
 
+def _run_one_site(site, min_price: int, max_price: int, test_mode: bool) -> list[dict]:
+    """Load and run the scraper for one site, returning [] if it fails."""
+    try:
+        scraper_class = load_scraper_class(site.scraper_class)
+        scraper = scraper_class(
+            min_price=min_price, max_price=max_price, test_mode=test_mode
+        )
+        return scraper.scrape_all()
+    except ImportError as e:
+        console.print(f"[yellow]Scraper not implemented yet: {site.name} ({e})[/]")
+    except Exception as e:
+        console.print(f"[red]Error scraping {site.name}: {e}[/]")
+    return []
+
+
 def run_pipeline(
     test_mode: bool = False,
     site_filter: Optional[list[str]] = None,
@@ -37,12 +55,14 @@ def run_pipeline(
     output_dir: Path = None,
     min_price: int = None,
     max_price: int = None,
+    use_llm_cache: bool = True,
+    llm_concurrency: int = None,
 ) -> list[dict]:
     """
     Run the full scraping pipeline.
 
     1. Get enabled sites (filtered if specified)
-    2. For each site, run the scraper
+    2. Run the scrapers for all sites concurrently
     3. Optionally enrich with LLM extraction
     4. Add geographic data
     5. Export to Excel and HTML
@@ -66,21 +86,24 @@ def run_pipeline(
 
     all_listings = []
 
-    # Run scrapers
-    for site in sites:
-        console.print(f"\n[bold cyan]>>> {site.name.upper()}[/]")
-
-        try:
-            scraper_class = load_scraper_class(site.scraper_class)
-            scraper = scraper_class(
-                min_price=min_price, max_price=max_price, test_mode=test_mode
+    # Run scrapers; each site is network-bound, so run them side by side
+    results = {}
+    with ThreadPoolExecutor(max_workers=min(8, len(sites))) as executor:
+        futures = {
+            executor.submit(_run_one_site, site, min_price, max_price, test_mode): site
+            for site in sites
+        }
+        for future in as_completed(futures):
+            site = futures[future]
+            results[site.name] = future.result()
+            console.print(
+                f"[bold cyan]>>> {site.name.upper()}[/] done "
+                f"({len(results[site.name])} listings)"
             )
-            listings = scraper.scrape_all()
-            all_listings.extend(listings)
-        except ImportError as e:
-            console.print(f"[yellow]Scraper not implemented yet: {site.name} ({e})[/]")
-        except Exception as e:
-            console.print(f"[red]Error scraping {site.name}: {e}[/]")
+
+    # Keep the configured site order regardless of completion order
+    for site in sites:
+        all_listings.extend(results[site.name])
 
     if not all_listings:
         console.print("[yellow]No listings scraped.[/]")
@@ -91,13 +114,10 @@ def run_pipeline(
     # LLM enrichment
     if not skip_llm:
         console.print("\n[bold cyan]Running LLM extraction...[/]")
-        extractor = OllamaExtractor()
+        extractor = OllamaExtractor(use_cache=use_llm_cache)
 
         if extractor.is_available():
-            for listing in tqdm(all_listings, desc="LLM extraction"):
-                raw_path = listing.get("raw_page_path")
-                if raw_path:
-                    listing.update(extractor.enrich_listing(listing, raw_path))
+            extractor.enrich_listings(all_listings, llm_concurrency)
         else:
             console.print(
                 "[yellow]Skipping LLM extraction (Ollama not available)[/]"
@@ -126,9 +146,11 @@ def run_pipeline(
         all_listings, output_dir, f"amsterdam_rentals_{timestamp}.html"
     )
 
-    # Also export latest versions without timestamp
-    export_to_excel(all_listings, output_dir, "amsterdam_rentals.xlsx")
-    export_to_html(all_listings, output_dir, "amsterdam_rentals.html")
+    # Also keep latest versions without timestamp, copied rather than rendered again
+    shutil.copyfile(excel_path, output_dir / "amsterdam_rentals.xlsx")
+    shutil.copyfile(html_path, output_dir / "amsterdam_rentals.html")
+    if HTML_WRITE_GZIP:
+        shutil.copyfile(f"{html_path}.gz", output_dir / "amsterdam_rentals.html.gz")
 
     console.print("\n[bold green]Pipeline complete![/]")
     console.print(f"  Listings: {len(all_listings)}")
@@ -7,6 +7,11 @@ from bs4 import BeautifulSoup
 
 from amsterdam_rent_scraper.scrapers.base import BaseScraper, console
 
+_AMOUNT_RE = re.compile(r"[\d,.]+")
+_SURFACE_RE = re.compile(r"(\d+)\s*m")
+_INT_RE = re.compile(r"(\d+)")
+_POSTAL_CODE_RE = re.compile(r"\b(\d{4}\s?[A-Z]{2})\b")
+
 
 class ParariusScraper(BaseScraper):
     """Scraper for pararius.com rental listings."""
@@ -88,7 +93,7 @@ class ParariusScraper(BaseScraper):
         if price_el:
             price_text = price_el.get_text(strip=True)
             # Extract number from "€1,500 per month"
-            price_match = re.search(r"[\d,.]+", price_text.replace(",", ""))
+            price_match = _AMOUNT_RE.search(price_text.replace(",", ""))
             if price_match:
                 try:
                     data["price_eur"] = float(price_match.group().replace(".", ""))
@@ -107,13 +112,13 @@ class ParariusScraper(BaseScraper):
 
             # Surface area
             if "m²" in text or "m2" in text:
-                match = re.search(r"(\d+)\s*m", text)
+                match = _SURFACE_RE.search(text)
                 if match:
                     data["surface_m2"] = float(match.group(1))
 
             # Rooms
             if "room" in text:
-                match = re.search(r"(\d+)", text)
+                match = _INT_RE.search(text)
                 if match:
                     data["rooms"] = int(match.group(1))
 
@@ -135,17 +140,17 @@ class ParariusScraper(BaseScraper):
             elif current_term:
                 value = item.get_text(strip=True)
                 if "bedroom" in current_term:
-                    match = re.search(r"(\d+)", value)
+                    match = _INT_RE.search(value)
                     if match:
                         data["bedrooms"] = int(match.group(1))
                 elif "bathroom" in current_term:
-                    match = re.search(r"(\d+)", value)
+                    match = _INT_RE.search(value)
                     if match:
                         data["bathrooms"] = int(match.group(1))
                 elif "available" in current_term:
                     data["available_date"] = value
                 elif "deposit" in current_term:
-                    match = re.search(r"[\d,.]+", value.replace(",", ""))
+                    match = _AMOUNT_RE.search(value.replace(",", ""))
                     if match:
                         try:
                             data["deposit_eur"] = float(match.group().replace(".", ""))
@@ -169,7 +174,7 @@ class ParariusScraper(BaseScraper):
 
         # Postal code from address
         if "address" in data:
-            postal_match = re.search(r"\b(\d{4}\s?[A-Z]{2})\b", data["address"])
+            postal_match = _POSTAL_CODE_RE.search(data["address"])
             if postal_match:
                 data["postal_code"] = postal_match.group(1).replace(" ", "")
 
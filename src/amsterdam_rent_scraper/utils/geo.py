@@ -1,13 +1,15 @@
 """Geographic utilities for distance and commute calculations."""
 
 import math
+from functools import lru_cache
 from typing import Optional, Tuple
 
 from geopy.geocoders import Nominatim
 from geopy.exc import GeocoderTimedOut
 from rich.console import Console
 
-from amsterdam_rent_scraper.config.settings import WORK_LAT, WORK_LNG
+from amsterdam_rent_scraper.config.settings import GEO_CACHE_PATH, WORK_LAT, WORK_LNG
+from amsterdam_rent_scraper.utils.geo_cache import GeocodeCache, address_key
 
 console = Console()
 
@@ -33,6 +35,30 @@ def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     return R * c
 
 
+@lru_cache(maxsize=None)
+def _disk_cache() -> Optional[GeocodeCache]:
+    """Open the persistent geocode cache on first use, or None if it cannot be opened."""
+    return GeocodeCache.open(GEO_CACHE_PATH, "Geocode")
+
+
+@lru_cache(maxsize=10000)
+def _lookup(address: str) -> Optional[Tuple[float, float]]:
+    """Query Nominatim once per distinct address; errors propagate and are not cached."""
+    cache = _disk_cache()
+    key = address_key(address)
+    coords = cache.get(key) if cache else None
+    if coords:
+        return tuple(coords)
+
+    location = geolocator.geocode(address, timeout=10)
+    if location:
+        coords = (location.latitude, location.longitude)
+        if cache:
+            cache.set(key, coords)
+        return coords
+    return None
+
+
 def geocode_address(address: str) -> Optional[Tuple[float, float]]:
     """Geocode an address to latitude/longitude coordinates."""
     if not address:
@@ -43,9 +69,7 @@ def geocode_address(address: str) -> Optional[Tuple[float, float]]:
         address = f"{address}, Netherlands"
 
     try:
-        location = geolocator.geocode(address, timeout=10)
-        if location:
-            return (location.latitude, location.longitude)
+        return _lookup(address)
     except GeocoderTimedOut:
         console.print(f"[yellow]Geocoding timed out for: {address}[/]")
     except Exception as e:
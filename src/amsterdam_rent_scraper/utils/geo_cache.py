@@ -0,0 +1,17 @@
+"""On-disk cache of geocoding results, keyed by the queried address."""
+
+import hashlib
+
+from amsterdam_rent_scraper.utils.sqlite_cache import SQLiteCache
+
+
+def address_key(address: str) -> str:
+    """Hash a normalized geocoding query into a short key."""
+    normalized = " ".join(address.lower().split())
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class GeocodeCache(SQLiteCache):
+    """Mapping from address_key() to [latitude, longitude]."""
+
+    table = "coordinates"
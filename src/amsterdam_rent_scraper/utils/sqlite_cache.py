@@ -0,0 +1,54 @@
+"""Small persistent key-value cache shared by the LLM and geocoding steps."""
+
+import sqlite3
+from pathlib import Path
+from typing import Any, Optional
+
+import orjson
+from rich.console import Console
+
+console = Console()
+
+
+class SQLiteCache:
+    """SQLite-backed mapping from a string key to an orjson-encoded value.
+
+    Subclasses pick the table. A cache only saves work, so read and write errors are
+    treated as misses rather than failing the step that uses it.
+    """
+
+    table: str = "entries"
+
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {self.table} (key TEXT PRIMARY KEY, data BLOB NOT NULL)"
+        )
+
+    @classmethod
+    def open(cls, path: Path, label: str) -> Optional["SQLiteCache"]:
+        """Open the cache at path, or warn and return None if it cannot be opened."""
+        try:
+            return cls(path)
+        except (OSError, sqlite3.Error) as e:
+            console.print(f"[yellow]{label} cache unavailable, running without it: {e}[/]")
+            return None
+
+    def get(self, key: str) -> Optional[Any]:
+        try:
+            row = self.conn.execute(f"SELECT data FROM {self.table} WHERE key = ?", (key,)).fetchone()
+        except sqlite3.Error:
+            return None
+        return orjson.loads(row[0]) if row else None
+
+    def set(self, key: str, value: Any) -> None:
+        try:
+            with self.conn:
+                self.conn.execute(
+                    f"INSERT OR REPLACE INTO {self.table} (key, data) VALUES (?, ?)",
+                    (key, orjson.dumps(value)),
+                )
+        except sqlite3.Error:
+            pass
@@ -0,0 +1,52 @@
+"""Tests for the HTML report export."""
+
+import json
+import re
+
+import pytest
+
+from amsterdam_rent_scraper.export.html_report import _script_json, export_to_html
+
+
+def test_script_json_escapes_markup():
+    text = '<!--<script>a & b</script>'
+    encoded = _script_json({"title": text})
+    assert not set("<>&") & set(encoded)
+    assert json.loads(encoded) == {"title": text}
+
+
+def test_untrusted_title_cannot_swallow_the_report_scripts(tmp_path):
+    html5lib = pytest.importorskip("html5lib")
+    listing = {"title": "<!--<script>", "price_eur": 1500, "listing_url": "https://example.com/1"}
+    path = export_to_html([listing], tmp_path, "report.html")
+    source = path.read_text(encoding="utf-8")
+
+    payload = re.search(r"const payload = (.*?);\n", source).group(1)
+    assert json.loads(payload)["rows"][0][1] == "<!--<script>"
+
+    document = html5lib.parse(source, namespaceHTMLElements=False)
+    scripts = [script.get("src") for script in document.iter("script")]
+    assert "filter-worker.js" in scripts
+    assert "report.js" in scripts
+
+
+@pytest.mark.parametrize("rooms", ["nan", "inf", "-inf", -40000, 10**6])
+def test_non_finite_and_out_of_range_values_do_not_abort_export(tmp_path, rooms):
+    listing = {"title": "Flat", "price_eur": "nan", "rooms": rooms, "listing_url": "https://example.com/1"}
+    assert export_to_html([listing], tmp_path, "report.html").exists()
+
+
+def test_server_rendered_rows_format_numbers_like_report_js(tmp_path):
+    listing = {
+        "title": "Flat",
+        "price_eur": 1500.0,
+        "surface_m2": 62.5,
+        "rooms": 2.0,
+        "listing_url": "https://example.com/1",
+    }
+    source = export_to_html([listing], tmp_path, "report.html").read_text(encoding="utf-8")
+    row = re.search(r'<tr class="listing-row" data-index="0">(.*?)</tr>', source, re.DOTALL).group(1)
+    cells = re.findall(r"<td[^>]*>(.*?)</td>", row, re.DOTALL)
+    assert cells[1] == "EUR 1500"
+    assert cells[3] == "62.5 m2"
+    assert cells[4] == "2"